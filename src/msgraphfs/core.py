@@ -1,10 +1,13 @@
 import asyncio
+import collections
 import datetime
+import functools
 import logging
 import mimetypes
 import os
-import re
+import random
 import threading
+import time
 import weakref
 from urllib.parse import urlparse
 
@@ -15,6 +18,7 @@ from fsspec.asyn import (
     AbstractBufferedFile,
     AsyncFileSystem,
     FSTimeoutError,
+    get_loop,
     sync,
     sync_wrapper,
 )
@@ -22,6 +26,11 @@ from fsspec.utils import tokenize
 from httpx import HTTPStatusError, Response
 from httpx._types import URLTypes
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 HTTPX_RETRYABLE_ERRORS = (
     asyncio.TimeoutError,
     httpx.NetworkError,
@@ -35,33 +44,116 @@ HTTPX_RETRYABLE_HTTP_STATUS_CODES = (500, 502, 503, 504)
 _logger = logging.getLogger(__name__)
 
 
-def get_running_loop():
-    """Get the currently running event loop."""
-    # this was removed from fsspec in https://github.com/fsspec/filesystem_spec/pull/1134
-    if hasattr(asyncio, "get_running_loop"):
-        return asyncio.get_running_loop()
-    else:
-        loop = asyncio._get_running_loop()
-        if loop is None:
-            raise RuntimeError("no running event loop")
-        else:
-            return loop
+def parse_range_header(range_header):
+    # Parse a range header like 'bytes=0-499' with plain string operations;
+    # the grammar is too simple to be worth a regex on the hot read path.
+    if not range_header.startswith("bytes="):
+        raise ValueError("Invalid Range header format")
+    start, sep, end = range_header[6:].partition("-")
+    if not sep:
+        raise ValueError("Invalid Range header format")
+    # start/end may be empty if the range is open-ended (e.g. 'bytes=100-')
+    return int(start) if start else None, int(end) if end else None
 
 
-def parse_range_header(range_header):
-    # Regular expression to match a range header like 'bytes=0-499'
-    range_pattern = r"bytes=(\d+)?-(\d+)?"
+def _json(response: Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
-    match = re.match(range_pattern, range_header)
 
-    if match:
-        start = match.group(1)
-        start = int(start) if start else None  # Convert to int if not None
-        end = match.group(2)  # Could be None if range is 'bytes=100-'
-        end = int(end) if end else None  # Convert to int if not None
-        return start, end
-    else:
-        raise ValueError("Invalid Range header format")
+def _parse_graph_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp as returned by the Graph API.
+
+    Graph always emits the fixed UTC layout ``YYYY-MM-DDTHH:MM:SS[.fff]Z``;
+    slicing the fields directly is much cheaper than the general-purpose
+    fromisoformat parser, which is kept as a fallback for anything else.
+    """
+    try:
+        if value[-1] in "Zz" and value[4] == "-" and value[10] == "T":
+            microsecond = 0
+            if len(value) > 20 and value[19] == ".":
+                microsecond = int(value[20:-1][:6].ljust(6, "0"))
+            return datetime.datetime(
+                int(value[:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                microsecond,
+                tzinfo=datetime.timezone.utc,
+            )
+    except (ValueError, IndexError):
+        pass
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class _LazyInfoDict(dict):
+    """fsspec info dict that defers timestamp parsing until accessed.
+
+    Listings store the raw ``createdDateTime``/``lastModifiedDateTime``
+    strings and only pay the parsing cost when a consumer actually reads
+    ``time`` or ``mtime`` — most directory walks never do.
+    """
+
+    _lazy_keys = ("time", "mtime")
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if key in self._lazy_keys and isinstance(value, str):
+            value = _parse_graph_datetime(value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def _consume_task_exception(task):
+    """Mark a background task's exception as retrieved.
+
+    Awaiting the task still raises; this only keeps asyncio from logging
+    "exception was never retrieved" when a prefetch is abandoned.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+class _BufferByteStream:
+    """Async-iterable request body reading straight from a buffer view.
+
+    Yields ``step``-sized bytes pieces of a memoryview, so httpx streams
+    the body without a full extra copy. ``__aiter__`` returns a fresh
+    generator each time, which keeps the body replayable when a request
+    is retried.
+    """
+
+    def __init__(self, view: memoryview, step: int = 2**16):
+        self._view = view
+        self._step = step
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        view, step = self._view, self._step
+        for pos in range(0, view.nbytes, step):
+            yield bytes(view[pos : pos + step])
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_type_from_suffix(suffix: str) -> str:
+    """Guess the MIME type for a file name suffix (e.g. ``.docx``).
+
+    Keyed by suffix rather than full path so repeated extensions hit the
+    cache instead of walking the MIME map again.
+    """
+    return mimetypes.guess_type("f" + suffix)[0] or "application/octet-stream"
 
 
 def split_parent_child(path: str) -> tuple[str, str]:
@@ -154,9 +246,11 @@ def wrap_http_not_found_exceptions(func):
         except HTTPStatusError as e:
             if e.response.status_code == 404:
                 path = e.request.url.path
-                if "root:" in path:
-                    path = path.split("root:")[-1]
-                    path = path[:-1] if path[-1] == ":" else path
+                # rpartition scans once; sep is empty when "root:" is absent
+                _, sep, tail = path.rpartition("root:")
+                if sep:
+                    # drop the closing ":" and any action suffix (":/versions", ...)
+                    path = tail.partition(":")[0]
                 raise FileNotFoundError(f"File not found: {path}") from e
             raise e
 
@@ -166,7 +260,7 @@ def wrap_http_not_found_exceptions(func):
 @wrap_http_not_found_exceptions
 async def _http_call_with_retry(func, *, args=(), kwargs=None, retries) -> Response:
     kwargs = kwargs or {}
-    retries = 1
+    retries = max(1, retries)
     for i in range(retries):
         try:
             response = await func(*args, **kwargs)
@@ -203,6 +297,7 @@ class AbstractMSGraphFS(AsyncFileSystem):
 
     retries = 5
     blocksize = 10 * 1024 * 1024  # 10 MB
+    item_id_cache_ttl = 60  # seconds
 
     def __init__(
         self,
@@ -211,8 +306,6 @@ class AbstractMSGraphFS(AsyncFileSystem):
         loop=None,
         **kwargs,
     ):
-        from fsspec.asyn import get_loop
-
         super_kwargs = kwargs.copy()
         super_kwargs.pop("use_listings_cache", None)
         super_kwargs.pop("listings_expiry_time", None)
@@ -225,17 +318,31 @@ class AbstractMSGraphFS(AsyncFileSystem):
         # Store initialization parameters for lazy initialization
         self._oauth2_client_params = oauth2_client_params
         self._client = None
+        self._status_client = None
         self._client_lock = threading.Lock() if not asynchronous else None
         self._client_pid = None  # Track which process created the client
         self.use_recycle_bin = kwargs.get("use_recycle_bin", False)
+        # cache of (reference, timestamp) keyed by (path, item_id), so chained
+        # operations (mkdir, mv, cp) don't re-resolve the same parents; shares
+        # item_id_cache_ttl to bound staleness from external changes
+        self._item_ref_cache = {}
+        # short-lived path -> (item_id, timestamp) cache; item ids are stable
+        # for the life of an item, the TTL only bounds staleness of deletions
+        # done outside this filesystem instance
+        self._item_id_cache = {}
 
     @property
     def client(self) -> AsyncOAuth2Client:
         """Lazy-initialized, fork-safe OAuth2 client."""
         current_pid = os.getpid()
 
-        # Check if we need to initialize or reinitialize after fork
-        if self._client is None or self._client_pid != current_pid:
+        # Check if we need to initialize or reinitialize after fork or after
+        # the pooled client was closed under us
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_pid != current_pid
+        ):
             if self.asynchronous:
                 # For async mode, we can't use locks, but async is typically single-threaded
                 self._init_client()
@@ -244,7 +351,11 @@ class AbstractMSGraphFS(AsyncFileSystem):
                 # Thread-safe lazy initialization for sync mode
                 with self._client_lock:
                     # Double-check after acquiring lock
-                    if self._client is None or self._client_pid != current_pid:
+                    if (
+                        self._client is None
+                        or self._client.is_closed
+                        or self._client_pid != current_pid
+                    ):
                         self._init_client()
                         self._client_pid = current_pid
 
@@ -261,16 +372,43 @@ class AbstractMSGraphFS(AsyncFileSystem):
                 # Ignore errors during cleanup
                 pass
 
-        # Create new client
+        # Create new client. HTTP/2 lets concurrent Graph calls multiplex on
+        # one TLS session instead of opening a connection per request.
         self._client = AsyncOAuth2Client(
             **self._oauth2_client_params,
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=64,
+                keepalive_expiry=30,
+            ),
         )
 
         # Register cleanup for non-async mode
         if not self.asynchronous:
             weakref.finalize(self, self.close_http_session, self._client, self.loop)
 
+    @property
+    def status_client(self) -> httpx.AsyncClient:
+        """Lazy-initialized HTTP client used to poll copy-status URLs.
+
+        The status URL returned by a copy operation is unauthenticated, so it
+        is polled with a plain client that carries no OAuth2 credentials.
+        Reusing a single pooled client keeps the connection alive between
+        polls instead of paying a TCP+TLS handshake for each one.
+        """
+        if self._status_client is None or self._status_client.is_closed:
+            self._status_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+            if not self.asynchronous:
+                weakref.finalize(
+                    self, self.close_http_session, self._status_client, self.loop
+                )
+        return self._status_client
+
     def __del__(self):
         """Destructor to ensure HTTP client is properly closed."""
         try:
@@ -284,13 +422,11 @@ class AbstractMSGraphFS(AsyncFileSystem):
         """Get the current event loop, following adlfs pattern."""
         try:
             # Need to confirm there is an event loop running in
-            # the thread. If not, create the fsspec loop
+            # the thread. If not, use the dedicated fsspec IO loop
             # and set it. This is to handle issues with
             # Async Credentials from the Azure SDK
-            loop = get_running_loop()
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            from fsspec.asyn import get_loop
-
             loop = get_loop()
             asyncio.set_event_loop(loop)
 
@@ -311,8 +447,10 @@ class AbstractMSGraphFS(AsyncFileSystem):
             try:
                 # Check if the loop is running
                 if loop.is_running():
-                    # Create a task to close the client
-                    loop.create_task(client.aclose())
+                    # Fire-and-forget: schedule the close on the loop thread
+                    # without blocking the caller (finalizers run during GC,
+                    # where waiting would stall the whole process)
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
                     return
                 else:
                     # If loop is not running, use sync with a short timeout
@@ -352,11 +490,12 @@ class AbstractMSGraphFS(AsyncFileSystem):
         parent_path = drive_item_info["parentReference"].get("path")
         if not parent_path:
             return "/"
-        # remove all the part before the "root:"
-        parent_path = parent_path.split("root:")[1]
+        # remove all the part before the "root:"; rpartition scans once and
+        # avoids the list allocation of split — this runs per listed item
+        _, _, parent_path = parent_path.rpartition("root:")
         if parent_path and not parent_path.startswith("/"):
             parent_path = "/" + parent_path
-        return parent_path + "/" + drive_item_info["name"]
+        return f"{parent_path}/{drive_item_info['name']}"
 
     def _drive_item_info_to_fsspec_info(self, drive_item_info: dict) -> dict:
         """Convert a drive item info to a fsspec info dictionary.
@@ -369,23 +508,20 @@ class AbstractMSGraphFS(AsyncFileSystem):
             _type = "directory"
         elif drive_item_info.get("file"):
             _type = "file"
-        data = {
-            "name": self._get_path(drive_item_info),
-            "size": drive_item_info.get("size", 0),
-            "type": _type,
-            "item_info": drive_item_info,
-            "time": datetime.datetime.fromisoformat(
-                drive_item_info.get("createdDateTime", "1970-01-01T00:00:00Z").replace(
-                    "Z", "+00:00"
-                )
-            ),
-            "mtime": datetime.datetime.fromisoformat(
-                drive_item_info.get(
+        data = _LazyInfoDict(
+            {
+                "name": self._get_path(drive_item_info),
+                "size": drive_item_info.get("size", 0),
+                "type": _type,
+                "item_info": drive_item_info,
+                # parsed lazily by _LazyInfoDict on first access
+                "time": drive_item_info.get("createdDateTime", "1970-01-01T00:00:00Z"),
+                "mtime": drive_item_info.get(
                     "lastModifiedDateTime", "1970-01-01T00:00:00Z"
-                ).replace("Z", "+00:00")
-            ),
-            "id": drive_item_info.get("id"),
-        }
+                ),
+                "id": drive_item_info.get("id"),
+            }
+        )
 
         # Add webUrl if available
         if "webUrl" in drive_item_info:
@@ -525,17 +661,36 @@ class AbstractMSGraphFS(AsyncFileSystem):
         Returns:
         str: The item ID of the file or directory if it exists, otherwise None.
         """
-        url = await self._path_to_url_async(path)
+        path = self._strip_protocol(path)
+        cached = self._item_id_cache.get(path)
+        if cached is not None and time.monotonic() - cached[1] < self.item_id_cache_ttl:
+            return cached[0]
         try:
-            response = await self._msgraph_get(url, params={"select": "id"})
-            return response.json()["id"]
+            item_id = (await self._probe(path))["id"]
         except FileNotFoundError:
             if throw_on_missing:
                 raise
             return None
+        self._item_id_cache[path] = (item_id, time.monotonic())
+        return item_id
 
     get_item_id = sync_wrapper(_get_item_id)
 
+    async def _probe(self, path: str, item_id: str | None = None) -> dict:
+        """Fetch the minimal facets needed for existence/type/size checks.
+
+        A single GET with ``select=id,file,folder,size`` answers the item id,
+        type and size questions at once, where calling ``_isfile``,
+        ``_get_item_id`` and ``_info`` separately costs one round trip each.
+        """
+        url = await self._path_to_url_async(path, item_id=item_id)
+        response = await self._msgraph_get(
+            url, params={"select": "id,file,folder,size"}
+        )
+        return _json(response)
+
+    probe = sync_wrapper(_probe)
+
     async def _get_item_reference(self, path: str, item_id: str | None = None) -> dict:
         """Return a dictionary with information about the item reference of the given
         path.
@@ -544,6 +699,10 @@ class AbstractMSGraphFS(AsyncFileSystem):
         use as an argument in other methods. see
         https://docs.microsoft.com/en-us/graph/api/resources/itemreference?view=graph-rest-1.0
         """
+        key = (self._strip_protocol(path), item_id)
+        cached = self._item_ref_cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.item_id_cache_ttl:
+            return cached[0]
         url = await self._path_to_url_async(path, item_id=item_id)
         response = await self._msgraph_get(
             url,
@@ -551,11 +710,31 @@ class AbstractMSGraphFS(AsyncFileSystem):
                 "select": "id,driveId,driveType,name,path,shareId,sharepointIds,siteId"
             },
         )
-        return response.json()
+        reference = _json(response)
+        self._item_ref_cache[key] = (reference, time.monotonic())
+        return reference
+
+    def invalidate_cache(self, path=None):
+        if path is None:
+            self._item_ref_cache.clear()
+            self._item_id_cache.clear()
+        else:
+            path = self._strip_protocol(path)
+            self._item_ref_cache = {
+                key: value
+                for key, value in self._item_ref_cache.items()
+                if key[0] != path and not key[0].startswith(path + "/")
+            }
+            self._item_id_cache = {
+                key: value
+                for key, value in self._item_id_cache.items()
+                if key != path and not key.startswith(path + "/")
+            }
+        super().invalidate_cache(path)
 
     @staticmethod
     def _guess_type(path: str) -> str:
-        return mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return _guess_type_from_suffix(os.path.splitext(path)[1])
 
     ################################################
     # Helper methods to call the Microsoft Graph API
@@ -607,6 +786,25 @@ class AbstractMSGraphFS(AsyncFileSystem):
 
     msgraph_patch = sync_wrapper(_msgraph_patch)
 
+    async def _msgraph_batch(self, requests: list[dict]) -> list[dict]:
+        """Send up to 20 requests in one call to the $batch endpoint.
+
+        Each request is a dict with at least "id", "method" and "url" keys,
+        where the url is relative to the Graph v1.0 root. The responses are
+        returned in request order, each with "id", "status" and "body" keys.
+        see https://learn.microsoft.com/en-us/graph/json-batching
+        """
+        response = await self._msgraph_post(
+            "https://graph.microsoft.com/v1.0/$batch",
+            json={"requests": requests},
+        )
+        responses = _json(response).get("responses", [])
+        # the service may answer out of order; restore the request order
+        order = {request["id"]: index for index, request in enumerate(requests)}
+        return sorted(responses, key=lambda r: order[r["id"]])
+
+    msgraph_batch = sync_wrapper(_msgraph_batch)
+
     ################################################
     # Others methods
     ################################################
@@ -620,8 +818,8 @@ class AbstractMSGraphFS(AsyncFileSystem):
         The ID of the resource that was copied. "percent_complete": The
         percentage of the copy operation that has completed.
         """
-        response = await httpx.AsyncClient().get(url)
-        value = response.json()
+        response = await self.status_client.get(url)
+        value = _json(response)
         return {
             "status": value.get("status"),
             "resource_id": value.get("resourceId"),
@@ -659,13 +857,17 @@ class AbstractMSGraphFS(AsyncFileSystem):
             status of the copy operation from a different process or machine (for exemple, in
             a web application).
         """
-        source_item_id = await self._get_item_id(path1, throw_on_missing=True)
+        path2 = self._strip_protocol(path2)
+        parent_path, _file_name = split_parent_child(path2)
+        # the source id and the destination parent reference are independent
+        # round trips, so fetch them concurrently
+        source_item_id, item_reference = await asyncio.gather(
+            self._get_item_id(path1, throw_on_missing=True),
+            self._get_item_reference(parent_path),
+        )
         url = await self._path_to_url_async(
             path1, item_id=source_item_id, action="copy"
         )
-        path2 = self._strip_protocol(path2)
-        parent_path, _file_name = split_parent_child(path2)
-        item_reference = await self._get_item_reference(parent_path)
         json = {
             "parentReference": item_reference,
             "name": _file_name,
@@ -675,13 +877,18 @@ class AbstractMSGraphFS(AsyncFileSystem):
         status_url = headers.get("Location")
         if not wait_completion:
             return status_url
+        # poll with exponential backoff and jitter (same ladder as
+        # _http_call_with_retry): fast copies are detected quickly while long
+        # ones are polled less and less often
+        delay = 0.1
         while True:
             status = await self._get_copy_status(status_url)
             if status["status"] == "completed":
                 break
             if status["status"] == "failed":
                 raise RuntimeError("Copy operation failed")
-            await asyncio.sleep(1)
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.2))
+            delay = min(delay * 1.7, 15)
 
     async def __delete_item(self, path: str, item_id: str | None = None, **kwargs):
         item_id = item_id or await self._get_item_id(path, throw_on_missing=True)
@@ -735,7 +942,7 @@ class AbstractMSGraphFS(AsyncFileSystem):
         if expand:
             params = {"expand": expand}
         response = await self._msgraph_get(url, params=params)
-        return self._drive_item_info_to_fsspec_info(response.json())
+        return self._drive_item_info_to_fsspec_info(_json(response))
 
     async def _ls(  # noqa: C901
         self,
@@ -779,11 +986,11 @@ class AbstractMSGraphFS(AsyncFileSystem):
         items = []
         try:
             response = await self._msgraph_get(url, params=params)
-            result = response.json()
+            result = _json(response)
             items = result.get("value", [])
             while "@odata.nextLink" in result:
                 response = await self._msgraph_get(result["@odata.nextLink"])
-                result = response.json()
+                result = _json(response)
                 items.extend(result.get("value", []))
         except HTTPStatusError as e:
             if (
@@ -834,24 +1041,54 @@ class AbstractMSGraphFS(AsyncFileSystem):
         async with await self.open_async(path, "wb") as f:
             await f.write(value)
 
-    async def _get_file(self, rpath: str, lpath: str, **kwargs):
-        headers = kwargs.get("headers", {})
-        content = await self._cat_file(rpath, **kwargs, headers=headers)
+    async def _get_file(self, rpath: str, lpath: str, chunk_size=2**20, **kwargs):
+        """Download a remote file to a local path.
+
+        The body is streamed from HTTP to disk chunk by chunk, so memory
+        stays bounded by ``chunk_size`` regardless of the file size.
+        """
+        headers = kwargs.pop("headers", {})
+        if kwargs.get("start") is not None or kwargs.get("end") is not None:
+            # ranged reads are bounded by construction; keep the buffered path
+            content = await self._cat_file(rpath, **kwargs, headers=headers)
+            with open(lpath, "wb") as f:
+                f.write(content)
+            return
         with open(lpath, "wb") as f:
-            f.write(content)
+            await self._stream_content(
+                rpath,
+                f,
+                item_id=kwargs.get("item_id"),
+                chunk_size=chunk_size,
+                params={"headers": headers} if headers else None,
+            )
 
     async def _put_file(self, lpath: str, rpath: str, **kwargs):
-        with open(lpath, "rb") as f:
-            data = f.read()
-        await self._pipe_file(rpath, data, **kwargs)
+        # read the local file block by block off the event loop (a plain
+        # read() would block it) and feed the remote file, which switches to
+        # a chunked upload session once more than one block is written;
+        # memory stays bounded by blocksize instead of the full file size
+        f = await asyncio.to_thread(open, lpath, "rb")
+        try:
+            async with await self.open_async(rpath, "wb", **kwargs) as remote:
+                while True:
+                    chunk = await asyncio.to_thread(f.read, self.blocksize)
+                    if not chunk:
+                        break
+                    await remote.write(chunk)
+        finally:
+            await asyncio.to_thread(f.close)
         while rpath:
             self.invalidate_cache(rpath)
             rpath = self._parent(rpath)
 
     async def _rm_file(self, path: str, item_id: str | None = None, **kwargs):
-        if not await self._isfile(path):
+        # one probe answers the type check and provides the item id for the
+        # delete, instead of one round trip for each
+        info = await self._probe(path, item_id=item_id)
+        if info.get("file") is None:
             raise FileNotFoundError(f"File not found: {path}")
-        await self.__delete_item(path, item_id=item_id, **kwargs)
+        await self.__delete_item(path, item_id=info["id"], **kwargs)
 
     async def _copy(
         self,
@@ -885,25 +1122,19 @@ class AbstractMSGraphFS(AsyncFileSystem):
         )
 
     async def _isfile(self, path: str) -> bool:
-        url = await self._path_to_url_async(path)
         try:
-            response = await self._msgraph_get(url, params={"select": "file"})
+            return (await self._probe(path)).get("file") is not None
         except FileNotFoundError:
             return False
-        return response.json().get("file") is not None
 
     async def _isdir(self, path: str) -> bool:
-        url = await self._path_to_url_async(path)
         try:
-            response = await self._msgraph_get(url, params={"select": "folder"})
+            return (await self._probe(path)).get("folder") is not None
         except FileNotFoundError:
             return False
-        return response.json().get("folder") is not None
 
     async def _size(self, path: str) -> int:
-        url = await self._path_to_url_async(path)
-        response = await self._msgraph_get(url, params={"select": "size"})
-        return response.json().get("size", 0)
+        return (await self._probe(path)).get("size", 0)
 
     async def _mkdir(self, path, create_parents=True, exist_ok=False, **kwargs) -> str:
         path = self._strip_protocol(path).rstrip("/")
@@ -923,7 +1154,7 @@ class AbstractMSGraphFS(AsyncFileSystem):
                 "@microsoft.graph.conflictBehavior": "fail",
             },
         )
-        return response.json()["id"]
+        return _json(response)["id"]
 
     async def _makedirs(self, path: str, exist_ok: bool = False):
         try:
@@ -949,12 +1180,15 @@ class AbstractMSGraphFS(AsyncFileSystem):
             directory will be deleted and moved to the recycle bin. If False,
             the directory will be permanently deleted. Default is False.
         """
-        if not await self._isdir(path):
+        try:
+            info = await self._probe(path)
+        except FileNotFoundError:
+            info = None
+        if info is None or info.get("folder") is None:
             raise FileNotFoundError(f"Directory not found: {path}")
         if await self._ls(path):
             raise OSError(f"Directory not empty: {path}")
-        item_id = await self._get_item_id(path, throw_on_missing=True)
-        await self.__delete_item(path, item_id=item_id, **kwargs)
+        await self.__delete_item(path, item_id=info["id"], **kwargs)
 
     rmdir = sync_wrapper(_rmdir)  # not into the list of async methods to auto wrap
 
@@ -965,20 +1199,35 @@ class AbstractMSGraphFS(AsyncFileSystem):
         for path in paths:
             if not recursive and await self._isdir(path) and await self._ls(path):
                 raise OSError(f"Directory not empty: {path}")
-            await self.__delete_item(path, **kwargs)
+        # the deletes are independent round trips, so run them concurrently;
+        # bound the fan-out to avoid Graph throttling
+        semaphore = asyncio.Semaphore(batch_size or 16)
+
+        async def _delete_one(path):
+            async with semaphore:
+                await self.__delete_item(path, **kwargs)
+
+        await asyncio.gather(*(_delete_one(path) for path in paths))
 
     async def _mv(self, path1, path2, **kwargs):
-        source_item_id = await self._get_item_id(path1, throw_on_missing=True)
-        url = await self._path_to_url_async(path1, item_id=source_item_id)
         path2 = self._strip_protocol(path2)
-        destination_item_id = await self._get_item_id(path2)
-        item_reference = None
-        name = None
-        if destination_item_id:
-            item_reference = await self._get_item_reference(path2)
-        else:
-            parent_path, name = split_parent_child(path2)
-            item_reference = await self._get_item_reference(parent_path)
+
+        async def _destination_reference():
+            # the item reference payload already contains the id, so one GET
+            # answers both "does the destination exist" and "what is its
+            # reference"; fall back to the parent when it does not exist
+            try:
+                return await self._get_item_reference(path2), None
+            except FileNotFoundError:
+                parent_path, name = split_parent_child(path2)
+                return await self._get_item_reference(parent_path), name
+
+        # the source and destination lookups are independent round trips
+        source_item_id, (item_reference, name) = await asyncio.gather(
+            self._get_item_id(path1, throw_on_missing=True),
+            _destination_reference(),
+        )
+        url = await self._path_to_url_async(path1, item_id=source_item_id)
         json = {
             "parentReference": item_reference,
         }
@@ -1029,10 +1278,19 @@ class AbstractMSGraphFS(AsyncFileSystem):
             Additional parameters used for s3 methods.  Typically used for
             ServerSideEncryption.
         """
-        if ("r" in mode or "a" in mode) and not self.isfile(path):
-            raise FileNotFoundError(f"File not found: {path}")
-        if "a" in mode and not size:
-            size = self.size(path)
+        # a single probe answers the existence check, the item id and the
+        # size, instead of one round trip for each
+        if "r" in mode or "a" in mode:
+            info = self.probe(path, item_id=item_id)
+            if info.get("file") is None:
+                raise FileNotFoundError(f"File not found: {path}")
+            item_id = item_id or info["id"]
+            if not size:
+                # passing the size on stops AbstractBufferedFile from
+                # re-fetching the info the probe just returned
+                size = info.get("size", 0)
+        elif item_id is None:
+            item_id = self.get_item_id(path)
         return MSGraphBufferedFile(
             fs=self,
             path=path,
@@ -1042,36 +1300,38 @@ class AbstractMSGraphFS(AsyncFileSystem):
             cache_type=cache_type,
             cache_options=cache_options,
             size=size,
-            item_id=item_id or self.get_item_id(path),
+            item_id=item_id,
             **kwargs,
         )
 
     async def open_async(self, path, mode="rb", **kwargs):
-        if ("r" in mode or "a" in mode) and not await self._isfile(path):
-            raise FileNotFoundError(f"File not found: {path}")
         if "b" not in mode or kwargs.get("compression"):
             raise ValueError
         size = None
-        item_id = kwargs.get("item_id") or await self._get_item_id(
-            path, throw_on_missing=False
-        )
-        if "rb" in mode or "a" in mode:
-            # we must provice the size of the file to the constructor
-            # to avoid the need to call the info method from within the constructor
-            # since in case of async running, the _info method is a coroutine
-            # and it's not allowed to call a coroutine from a constructor. If the
-            # size is provided, the info method will not be called from the constructor
-            info = await self._info(path)
-            size = info["size"]
+        item_id = kwargs.pop("item_id", None)
+        if "r" in mode or "a" in mode:
+            # a single probe answers the existence check, the item id and the
+            # size. We must provide the size of the file to the constructor
+            # to avoid the need to call the info method from within the
+            # constructor since in case of async running, the _info method is
+            # a coroutine and it's not allowed to call a coroutine from a
+            # constructor.
+            info = await self._probe(path, item_id=item_id)
+            if info.get("file") is None:
+                raise FileNotFoundError(f"File not found: {path}")
+            item_id = item_id or info["id"]
+            size = info.get("size", 0)
+        elif item_id is None:
+            item_id = await self._get_item_id(path, throw_on_missing=False)
         return MSGraphStreamedFile(
             self, path, mode, size=size, item_id=item_id, **kwargs
         )
 
     async def _touch(self, path, truncate=True, item_id=None, **kwargs):
-        # if the file exists, update the last modified date time
-        # otherwise, create an empty file"""
+        # if the file exists, truncate it or update the last modified date
+        # time, otherwise create an empty file
         item_id = item_id or await self._get_item_id(path)
-        if item_id and not truncate:
+        if item_id:
             if truncate:
                 url = await self._path_to_url_async(
                     path, item_id=item_id, action="content"
@@ -1079,12 +1339,17 @@ class AbstractMSGraphFS(AsyncFileSystem):
                 await self._msgraph_put(
                     url,
                     content=b"",
-                    headers={"Content-Type": "application/octet-stream"},
+                    headers={"Content-Type": self._guess_type(path)},
                 )
             else:
                 url = await self._path_to_url_async(path, item_id=item_id)
                 await self._msgraph_patch(
-                    url, json={"lastModifiedDateTime": datetime.now().isoformat()}
+                    url,
+                    json={
+                        "lastModifiedDateTime": datetime.datetime.now(
+                            datetime.timezone.utc
+                        ).isoformat()
+                    },
                 )
         else:
             parent_path, file_name = split_parent_child(path)
@@ -1142,12 +1407,66 @@ class AbstractMSGraphFS(AsyncFileSystem):
 
     get_content = sync_wrapper(_get_content)
 
+    async def _stream_content(  # noqa: C901
+        self, path, sink, item_id=None, chunk_size=2**20, params=None
+    ):
+        """Stream the item content into a writable ``sink``.
+
+        Unlike :meth:`_get_content`, the body is never held in memory in
+        full: it is written to ``sink`` (any object with a ``write`` method,
+        such as an open file) in ``chunk_size`` pieces.
+
+        Parameters:
+            sink: writable object receiving the content chunks.
+            item_id (str): The ID of the item to get the content of.
+            chunk_size (int): size of the pieces written to the sink.
+            params (dict): Additional parameters to pass to the request.
+        """
+        params = params or {}
+        url = await self._path_to_url_async(path, item_id=item_id, action="content")
+        if self.client.token is None:
+            await self.client.fetch_token()
+        # _http_call_with_retry only handles unary request/response, so the
+        # streaming download carries its own retry loop with the same ladder
+        for i in range(self.retries):
+            wrote = False
+            try:
+                async with self.client.stream("GET", url, **params) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        wrote = True
+                        sink.write(chunk)
+                return
+            except HTTPX_RETRYABLE_ERRORS as e:
+                if i == self.retries - 1:
+                    raise e
+                _logger.debug("Retryable error: %s", e)
+            except HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    raise FileNotFoundError(f"File not found: {path}") from e
+                if (
+                    e.response.status_code not in HTTPX_RETRYABLE_HTTP_STATUS_CODES
+                    or i == self.retries - 1
+                ):
+                    raise e
+                _logger.debug("Retryable HTTP status code: %s", e.response.status_code)
+            if wrote:
+                # retrying restarts the body from the beginning
+                if not getattr(sink, "seekable", lambda: False)():
+                    raise OSError(
+                        f"Cannot retry streaming download of {path}: sink "
+                        "already received data and is not seekable"
+                    )
+                sink.seek(0)
+                sink.truncate()
+            await asyncio.sleep(min(1.7**i * 0.1, 15))
+
+    stream_content = sync_wrapper(_stream_content)
+
     async def _preview(self, path, item_id: str | None = None) -> str:
-        if not await self._isfile(path):
-            raise FileNotFoundError(f"File not found: {path}")
         url = await self._path_to_url_async(path, item_id=item_id, action="preview")
         response = await self._msgraph_post(url)
-        return response.json().get("getUrl", [])
+        return _json(response).get("getUrl", [])
 
     preview = sync_wrapper(_preview)
 
@@ -1163,8 +1482,6 @@ class AbstractMSGraphFS(AsyncFileSystem):
             If given, the item_id will be used instead of the path to check
             out the file.
         """
-        if not await self._isfile(path):
-            raise FileNotFoundError(f"File not found: {path}")
         url = await self._path_to_url_async(path, item_id=item_id, action="checkout")
         await self._msgraph_post(url)
 
@@ -1184,8 +1501,6 @@ class AbstractMSGraphFS(AsyncFileSystem):
             If given, the item_id will be used instead of the path to check
             in the file.
         """
-        if not await self._isfile(path):
-            raise FileNotFoundError(f"File not found: {path}")
         url = await self._path_to_url_async(path, item_id=item_id, action="checkin")
         await self._msgraph_post(url, json={"comment": comment})
 
@@ -1202,20 +1517,68 @@ class AbstractMSGraphFS(AsyncFileSystem):
             If given, the item_id will be used instead of the path to get
             the versions of the file.
         """
-        if not await self._isfile(path):
-            raise FileNotFoundError(f"File not found: {path}")
         url = await self._path_to_url_async(path, item_id=item_id, action="versions")
         response = await self._msgraph_get(url)
-        result = response.json()
+        result = _json(response)
         items = result.get("value", [])
         while "@odata.nextLink" in result:
             response = await self._msgraph_get(result["@odata.nextLink"])
-            result = response.json()
+            result = _json(response)
             items.extend(result.get("value", []))
         return items
 
     get_versions = sync_wrapper(_get_versions)
 
+    async def _get_versions_many(self, paths: list[str]) -> dict[str, list[dict]]:
+        """Get the versions of several files at once.
+
+        The per-file version listings are combined into $batch calls of up
+        to 20 requests (the Graph batch limit) issued concurrently, instead
+        of one round trip per file.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Paths of the files to get the versions of
+        """
+        urls = []
+        for path in paths:
+            url = await self._path_to_url_async(path, action="versions")
+            urls.append(url.removeprefix("https://graph.microsoft.com/v1.0"))
+
+        async def _one_batch(batch: list[tuple[str, str]]) -> dict[str, list[dict]]:
+            requests = [
+                {"id": str(index), "method": "GET", "url": url}
+                for index, (_path, url) in enumerate(batch)
+            ]
+            responses = await self._msgraph_batch(requests)
+            results = {}
+            # a response set that doesn't match the requests one-to-one is a
+            # protocol violation; fail loudly instead of dropping paths
+            for (path, _url), response in zip(batch, responses, strict=True):
+                status = response.get("status")
+                if status == 404:
+                    raise FileNotFoundError(f"File not found: {path}")
+                if status != 200:
+                    raise OSError(f"Failed to get versions of {path}: HTTP {status}")
+                result = response.get("body", {})
+                items = result.get("value", [])
+                while "@odata.nextLink" in result:
+                    page = await self._msgraph_get(result["@odata.nextLink"])
+                    result = _json(page)
+                    items.extend(result.get("value", []))
+                results[path] = items
+            return results
+
+        pairs = list(zip(paths, urls, strict=True))
+        batches = [pairs[index : index + 20] for index in range(0, len(pairs), 20)]
+        results: dict[str, list[dict]] = {}
+        for partial in await asyncio.gather(*(_one_batch(batch) for batch in batches)):
+            results.update(partial)
+        return results
+
+    get_versions_many = sync_wrapper(_get_versions_many)
+
     async def _get_sharepoint_ids(self, path: str, item_id: str | None = None) -> dict:
         """Get the SharePoint IDs of a file or directory on a SharePoint site.
 
@@ -1229,7 +1592,7 @@ class AbstractMSGraphFS(AsyncFileSystem):
         """
         url = await self._path_to_url_async(path, item_id=item_id)
         response = await self._msgraph_get(url, params={"select": "sharepointIds"})
-        return response.json().get("sharepointIds", {})
+        return _json(response).get("sharepointIds", {})
 
     get_sharepoint_ids = sync_wrapper(_get_sharepoint_ids)
 
@@ -1291,13 +1654,13 @@ class AbstractMSGraphFS(AsyncFileSystem):
         """
         url = await self._path_to_url_async(path, item_id=item_id, action="permissions")
         response = await self._msgraph_get(url)
-        result = response.json()
+        result = _json(response)
         permissions = result.get("value", [])
 
         # Handle pagination
         while "@odata.nextLink" in result:
             response = await self._msgraph_get(result["@odata.nextLink"])
-            result = response.json()
+            result = _json(response)
             permissions.extend(result.get("value", []))
 
         return self._format_permissions(permissions)
@@ -1495,6 +1858,11 @@ class MSGDriveFS(AbstractMSGraphFS):
             self.drive_url = f"https://graph.microsoft.com/v1.0/drives/{self.drive_id}"
         else:
             self.drive_url = None
+        # resolved lazily by _get_site_id; a site keeps its id forever
+        self._site_id = None
+        # bounded LRU of computed item URLs; the mapping is deterministic
+        # (keyed on the drive URL too), so entries never go stale
+        self._url_cache = collections.OrderedDict()
 
     def _parse_path_for_url_routing(self, path: str):
         """Parse a path to extract site_name, drive_name, and file path for URL
@@ -1686,7 +2054,7 @@ class MSGDriveFS(AbstractMSGraphFS):
                 response = await self._msgraph_get(
                     "https://graph.microsoft.com/v1.0/me/drive"
                 )
-                drive_info = response.json()
+                drive_info = _json(response)
                 self.drive_id = drive_info["id"]
                 self.drive_url = (
                     f"https://graph.microsoft.com/v1.0/drives/{self.drive_id}"
@@ -1713,7 +2081,7 @@ class MSGDriveFS(AbstractMSGraphFS):
                 response = await self._msgraph_get(
                     f"https://graph.microsoft.com/v1.0/sites/{site_id}/drive"
                 )
-                drive_info = response.json()
+                drive_info = _json(response)
                 self.drive_id = drive_info["id"]
                 self.drive_url = (
                     f"https://graph.microsoft.com/v1.0/drives/{self.drive_id}"
@@ -1726,16 +2094,27 @@ class MSGDriveFS(AbstractMSGraphFS):
             # Use sync wrapper to ensure drive_id
             self.ensure_drive_id()
 
+        key = (self.drive_url, path, item_id, action)
+        url = self._url_cache.get(key)
+        if url is not None:
+            self._url_cache.move_to_end(key)
+            return url
+
         action = action and f"/{action}" if action else ""
-        path = self._strip_protocol(path).rstrip("/")
-        if path and not path.startswith("/"):
-            path = "/" + path
-        if path:
-            path = f":{path}:"
+        stripped = self._strip_protocol(path).rstrip("/")
+        if stripped and not stripped.startswith("/"):
+            stripped = "/" + stripped
+        if stripped:
+            stripped = f":{stripped}:"
         if item_id:
-            return f"{self.drive_url}/items/{item_id}{action}"
+            url = f"{self.drive_url}/items/{item_id}{action}"
+        else:
+            url = f"{self.drive_url}/root{stripped}{action}"
 
-        return f"{self.drive_url}/root{path}{action}"
+        self._url_cache[key] = url
+        if len(self._url_cache) > 1024:
+            self._url_cache.popitem(last=False)
+        return url
 
     async def _path_to_url_async(self, path, item_id=None, action=None) -> str:
         """Async version of _path_to_url that ensures drive_id is available."""
@@ -1744,20 +2123,35 @@ class MSGDriveFS(AbstractMSGraphFS):
         return self._path_to_url(path, item_id, action)
 
     async def _get_site_id(self) -> str:
+        if self._site_id:
+            return self._site_id
         if not self.site_name:
             raise ValueError("site_name is required to get site_id")
-        url = f"https://graph.microsoft.com/v1.0/sites?search={self.site_name}"
-        response = await self._msgraph_get(url)
-        sites = response.json().get("value", [])
+        # let httpx encode the query, site names may contain spaces etc.
+        response = await self._msgraph_get(
+            "https://graph.microsoft.com/v1.0/sites",
+            params={"search": self.site_name},
+        )
+        sites = _json(response).get("value", [])
         if not sites:
             raise ValueError(f"No site found with name '{self.site_name}'")
-        return sites[0]["id"]
+        # the search is fuzzy; prefer an exact match when there is one
+        site = next(
+            (
+                s
+                for s in sites
+                if self.site_name in (s.get("name"), s.get("displayName"))
+            ),
+            sites[0],
+        )
+        self._site_id = site["id"]
+        return self._site_id
 
     async def _get_drive_id_by_name(self, site_id: str, drive_name: str) -> str:
         """Get the drive ID for a specific drive name within a site."""
         url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives"
         response = await self._msgraph_get(url)
-        drives = response.json().get("value", [])
+        drives = _json(response).get("value", [])
 
         for drive in drives:
             if drive.get("name") == drive_name:
@@ -1792,7 +2186,7 @@ class MSGDriveFS(AbstractMSGraphFS):
         site_id = await self._get_site_id()
         url = f"https://graph.microsoft.com/beta/sites/{site_id}/recycleBin/items"
         response = await self._msgraph_get(url)
-        return response.json().get("value", [])
+        return _json(response).get("value", [])
 
     get_recycle_bin_items = sync_wrapper(_get_recycle_bin_items)
     ensure_drive_id = sync_wrapper(_ensure_drive_id)
@@ -1879,6 +2273,18 @@ class MSGDriveFS(AbstractMSGraphFS):
         else:
             return await drive_fs._rm(file_path, recursive=recursive, **kwargs)
 
+    async def _get_file(self, rpath: str, lpath: str, **kwargs):
+        """Download a file, supporting path-based site/drive resolution."""
+        site_name, drive_name, file_path = self._parse_path_for_missing_components(
+            rpath
+        )
+        drive_fs = self._get_drive_fs(site_name, drive_name)
+
+        if drive_fs is self:
+            return await super()._get_file(file_path, lpath, **kwargs)
+        else:
+            return await drive_fs._get_file(file_path, lpath, **kwargs)
+
 
 class AsyncStreamedFileMixin:
     """Mixin for streamed file-like objects using async iterators."""
@@ -1894,9 +2300,19 @@ class AsyncStreamedFileMixin:
             if self.blocksize % (320 * 1024) != 0:
                 raise ValueError("block_size must be a multiple of 320 KiB")
         self._item_id = kwargs.get("item_id")
-        self._append_mode = "a" in self.mode and self.item_id is not None
+        self._resolved_id = None
+        self._append_mode = "a" in self.mode and self._item_id is not None
         if self._append_mode:
             self.loc = kwargs.get("size", 0)
+        # the MIME type never changes for the life of the handle
+        self._content_type = (
+            self.fs._guess_type(self.path)
+            if "w" in self.mode or "a" in self.mode
+            else None
+        )
+        # sequential readahead state (read mode only)
+        self._prefetch_task = None
+        self._prefetch_range = None
         self._reset_session_info()
 
     @property
@@ -1910,6 +2326,24 @@ class AsyncStreamedFileMixin:
 
     get_item_id = sync_wrapper(_get_item_id)
 
+    async def _resolved_item_id(self) -> str:
+        """Item id usable in an upload URL, resolved once and memoized.
+
+        For a file that does not exist yet this is the parent-relative
+        ``{parent_id}:/{name}:`` form, which the Graph API accepts wherever
+        an item id is expected.
+        """
+        if self._resolved_id is None:
+            item_id = await self.item_id
+            if not item_id:
+                parent_path, file_name = split_parent_child(self.path)
+                parent_id = await self.fs._get_item_id(
+                    parent_path, throw_on_missing=True
+                )
+                item_id = f"{parent_id}:/{file_name}:"
+            self._resolved_id = item_id
+        return self._resolved_id
+
     async def _create_upload_session(self) -> tuple[str, datetime.datetime]:
         """Create a new upload session for the file.
 
@@ -1918,13 +2352,10 @@ class AsyncStreamedFileMixin:
 
         see https://learn.microsoft.com/en-us/graph/api/driveitem-createuploadsession?view=graph-rest-1.0
         """
-        item_id = await self.item_id
-        if not item_id:
-            parent_path, file_name = split_parent_child(self.path)
-            parent_id = await self.fs._get_item_id(parent_path)
-            item_id = f"{parent_id}:/{file_name}:"
         url = self.fs._path_to_url(
-            self.path, item_id=item_id, action="createUploadSession"
+            self.path,
+            item_id=await self._resolved_item_id(),
+            action="createUploadSession",
         )
         response = await self.fs._msgraph_post(
             url,
@@ -1934,8 +2365,8 @@ class AsyncStreamedFileMixin:
                 "deferCommit": True,
             },
         )
-        json = response.json()
-        expiration_dt = datetime.datetime.fromisoformat(json["expirationDateTime"])
+        json = _json(response)
+        expiration_dt = _parse_graph_datetime(json["expirationDateTime"])
         return json["uploadUrl"], expiration_dt
 
     @property
@@ -1943,7 +2374,7 @@ class AsyncStreamedFileMixin:
         """Check if the current upload session is expired."""
         if not self._upload_expiration_dt:
             return True
-        now = datetime.datetime.now(datetime.UTC)
+        now = datetime.datetime.now(datetime.timezone.utc)
         return now > self._upload_expiration_dt
 
     def _reset_session_info(self):
@@ -1951,30 +2382,80 @@ class AsyncStreamedFileMixin:
         self._upload_session_url = None
         self._upload_expiration_dt = None
         self._chunk_start_pos = 0
-        self._remaining_bytes = None
+        # reusable buffer for the sub-blocksize tail carried between flushes;
+        # emptied in place so its capacity is kept across sessions
+        if not hasattr(self, "_carry"):
+            self._carry = bytearray()
+        else:
+            del self._carry[:]
         self._write_called = False
+        self._upload_task = None
+        self._session_task = None
+        self._chunks_since_expiry_check = 0
 
-    async def _upload_content_at_once(self, data):
-        headers = self.kwargs.get("headers", {})
-        if "content-type" not in headers:
-            headers["content-type"] = self.fs._guess_type(self.path)
-        item_id = await self.item_id
-        if not item_id:
-            parent_path, file_name = split_parent_child(self.path)
-            parent_id = await self.fs._get_item_id(parent_path, throw_on_missing=True)
-            item_id = f"{parent_id}:/{file_name}:"
-        url = self.fs._path_to_url(self.path, item_id=item_id, action="content")
-        await self.fs._msgraph_put(url, content=data, headers=headers)
+    async def _upload_content_at_once(self, buffer):
+        """PUT the whole content of ``buffer`` (a BytesIO) in one request.
+
+        The body is streamed out of the buffer in small pieces instead of
+        being materialized as one full bytes copy; the Graph content
+        endpoint does not accept chunked transfer encoding, so the
+        Content-Length is set explicitly from the buffer size.
+        """
+        # copy: self.kwargs must not grow Content-Length/content-type entries
+        headers = dict(self.kwargs.get("headers", {}))
+        headers.setdefault("content-type", self._content_type)
+        view = buffer.getbuffer()
+        try:
+            headers["Content-Length"] = str(view.nbytes)
+            url = self.fs._path_to_url(
+                self.path, item_id=await self._resolved_item_id(), action="content"
+            )
+            await self.fs._msgraph_put(
+                url, content=_BufferByteStream(view), headers=headers
+            )
+        finally:
+            view.release()
         self.fs.invalidate_cache(self.path)
 
+    async def _wait_for_inflight_chunks(self):
+        """Wait for the background chunk PUTs, surfacing their failure."""
+        if self._upload_task is not None:
+            task, self._upload_task = self._upload_task, None
+            await task
+
+    async def _resolve_session_task(self) -> tuple[str, datetime.datetime]:
+        """Return the upload session, awaiting the eagerly started creation task
+        if there is one."""
+        if self._session_task is not None:
+            task, self._session_task = self._session_task, None
+            return await task
+        return await self._create_upload_session()
+
     async def _abort_upload_session(self):
         """Abort the current upload session."""
+        try:
+            await self._wait_for_inflight_chunks()
+        except Exception:
+            # the session is being aborted anyway
+            _logger.debug("In-flight chunk upload failed during abort", exc_info=True)
+        if self._session_task is not None and not self._upload_session_url:
+            # an eagerly created session that was never used must still be
+            # deleted, otherwise the file would be truncated on expiry
+            task, self._session_task = self._session_task, None
+            try:
+                self._upload_session_url, self._upload_expiration_dt = await task
+            except Exception:
+                _logger.debug(
+                    "Eager upload session creation failed during abort",
+                    exc_info=True,
+                )
         if self._upload_session_url and not self._is_upload_session_expired:
             await self.fs._msgraph_delete(self._upload_session_url)
         self._reset_session_info()
 
     async def _commit_upload_session(self):
         """Commit the current upload session."""
+        await self._wait_for_inflight_chunks()
         if self._upload_session_url and self._is_upload_session_expired:
             raise RuntimeError("The upload session has expired.")
         if self._upload_session_url:
@@ -1995,9 +2476,9 @@ class AsyncStreamedFileMixin:
             if self.buffer is not None:
                 if not append_no_write:
                     _logger.debug("One-shot upload of %s" % self)
-                    self.buffer.seek(0)
-                    data = self.buffer.read()
-                    await self._upload_content_at_once(data)
+                    await self._upload_content_at_once(self.buffer)
+                    # the eagerly created upload session, if any, went unused
+                    await self._abort_upload_session()
             else:
                 raise RuntimeError
 
@@ -2009,16 +2490,15 @@ class AsyncStreamedFileMixin:
             await self._commit_upload_session()
 
         # complex cache invalidation, since file's appearance can cause several
-        # directories
+        # directories; only drop listings that don't already contain the child
         parts = self.path.split("/")
-        path = parts[0]
-        for p in parts[1:]:
-            if path in self.fs.dircache and not [
-                True for f in self.fs.dircache[path] if f["name"] == path + "/" + p
-            ]:
-                self.fs.invalidate_cache(path)
-            path = path + "/" + p
-        pass
+        parent = parts[0]
+        for part in parts[1:]:
+            child = f"{parent}/{part}"
+            entries = self.fs.dircache.get(parent)
+            if entries is not None and not any(f["name"] == child for f in entries):
+                self.fs.invalidate_cache(parent)
+            parent = child
 
     commit = sync_wrapper(_commit)
 
@@ -2035,6 +2515,18 @@ class AsyncStreamedFileMixin:
             content = await self.fs._cat_file(self.path, item_id=self._item_id)
             self.buffer.write(content)
             self.loc = len(content)
+        if (
+            ("w" in self.mode or "a" in self.mode)
+            and self._session_task is None
+            and not self._upload_session_url
+            and (not self.autocommit or self.loc >= self.blocksize)
+        ):
+            # a chunked upload is certain here (one-shot PUTs only happen for
+            # autocommit files smaller than one block), so start creating the
+            # session in the background while the caller is still filling the
+            # first block; speculating on other handles would cost small files
+            # an extra create+delete round trip
+            self._session_task = asyncio.ensure_future(self._create_upload_session())
 
     ########################################################
     ## AbstractBufferedFile methods to implement or override
@@ -2049,45 +2541,81 @@ class AsyncStreamedFileMixin:
             This is the last block, so should complete file, if
             self.autocommit is True.
         """
-        if self.autocommit and final and self.tell() < self.blocksize:
-            # only happens when closing small file, use on-shot PUT
-            chunk_to_write = False
-        else:
-            self.buffer.seek(0)
-            if self._remaining_bytes:
-                chunk_to_write = self._remaining_bytes + self.buffer.read(
-                    self.blocksize - len(self._remaining_bytes)
-                )
-                self._remaining_bytes = None
-            else:
-                chunk_to_write = self.buffer.read(self.blocksize)
         # we must write into chunk of the same block size. We therefore need to
         # buffer the remaining bytes if the buffer is not a multiple of the block size
-        while chunk_to_write:
-            chunk_size = len(chunk_to_write)
-            if chunk_size < self.blocksize and not final:
-                self._remaining_bytes = chunk_to_write
-                break
-
-            headers = {
-                "Content-Length": str(chunk_size),
-                "Content-Range": f"bytes {self._chunk_start_pos}-{self._chunk_start_pos + chunk_size - 1}/*",
-            }
-            response = await self.fs._msgraph_put(
-                self._upload_session_url,
-                content=chunk_to_write,
-                headers=headers,
-            )
-            self._upload_expiration_dt = datetime.datetime.fromisoformat(
-                response.json()["expirationDateTime"]
+        chunks = []
+        if not (self.autocommit and final and self.tell() < self.blocksize):
+            # slice the buffer through a memoryview so finding the block
+            # boundaries doesn't copy; each chunk is materialized to bytes
+            # exactly once, when handed to the background uploader
+            view = self.buffer.getbuffer()
+            try:
+                pos = 0
+                if self._carry:
+                    pos = self.blocksize - len(self._carry)
+                    self._carry += view[:pos]
+                    if len(self._carry) == self.blocksize or final:
+                        chunks.append((self._chunk_start_pos, bytes(self._carry)))
+                        self._chunk_start_pos += len(self._carry)
+                        del self._carry[:]
+                while pos < len(view):
+                    chunk = view[pos : pos + self.blocksize]
+                    if len(chunk) < self.blocksize and not final:
+                        self._carry += chunk
+                        break
+                    chunks.append((self._chunk_start_pos, bytes(chunk)))
+                    self._chunk_start_pos += len(chunk)
+                    pos += len(chunk)
+            finally:
+                view.release()
+
+        if chunks:
+            # Graph upload sessions require ranges to arrive contiguously and
+            # in order, so the PUTs cannot be fanned out; chaining them on the
+            # previous dispatch in a background task still lets the caller
+            # refill its buffer while the network is busy
+            self._upload_task = asyncio.create_task(
+                self._put_chunk_ranges(self._upload_task, chunks)
             )
-            self._chunk_start_pos += chunk_size
-            chunk_to_write = self.buffer.read(self.blocksize)
 
         if self.autocommit and final:
             await self._commit()
         return not final
 
+    async def _put_chunk_ranges(self, previous, chunks):
+        """PUT ``(start, data)`` ranges to the upload session, in order, once
+        ``previous`` (the task uploading the preceding ranges) is done."""
+        if previous is not None:
+            await previous
+        # the PUTs are serialized, so one headers dict can be reused; hoist
+        # the attribute lookups out of the loop as well
+        put = self.fs._msgraph_put
+        url = self._upload_session_url
+        headers = {}
+        for start, data in chunks:
+            chunk_size = len(data)
+            headers["Content-Length"] = str(chunk_size)
+            headers["Content-Range"] = f"bytes {start}-{start + chunk_size - 1}/*"
+            response = await put(
+                url,
+                content=data,
+                headers=headers,
+            )
+            # The session expiry is refreshed on every PUT but barely moves;
+            # re-parse it only periodically, or when the known expiry gets
+            # close enough that drift would matter.
+            self._chunks_since_expiry_check += 1
+            if self._chunks_since_expiry_check >= 16 or (
+                self._upload_expiration_dt is not None
+                and self._upload_expiration_dt
+                - datetime.datetime.now(datetime.timezone.utc)
+                < datetime.timedelta(minutes=2)
+            ):
+                self._upload_expiration_dt = _parse_graph_datetime(
+                    _json(response)["expirationDateTime"]
+                )
+                self._chunks_since_expiry_check = 0
+
     async def _initiate_upload(self):
         if self.autocommit and self.tell() < self.blocksize:
             # only happens when closing small file, use on-shot PUT
@@ -2098,12 +2626,39 @@ class AsyncStreamedFileMixin:
         (
             self._upload_session_url,
             self._upload_expiration_dt,
-        ) = await self._create_upload_session()
+        ) = await self._resolve_session_task()
 
     async def _fetch_range(self, start, end) -> bytes:
-        """Get the specified set of bytes from remote."""
-        item_id = await self.fs._get_item_id(self.path)
-        return await self.fs._cat_file(self.path, start=start, end=end, item_id=item_id)
+        """Get the specified set of bytes from remote.
+
+        For sequential reads, the block following the requested one is
+        prefetched in the background so the next call usually finds its
+        bytes already in flight.
+        """
+        item_id = await self.item_id
+        data = None
+        if self._prefetch_task is not None:
+            task, prefetched = self._prefetch_task, self._prefetch_range
+            self._prefetch_task = self._prefetch_range = None
+            if prefetched == (start, end):
+                data = await task
+            else:
+                # random access; the readahead guessed wrong
+                task.cancel()
+        if data is None:
+            data = await self.fs._cat_file(
+                self.path, start=start, end=end, item_id=item_id
+            )
+        if self.size is not None and end < self.size and end > start:
+            next_end = min(end + (end - start), self.size)
+            self._prefetch_range = (end, next_end)
+            self._prefetch_task = asyncio.create_task(
+                self.fs._cat_file(self.path, start=end, end=next_end, item_id=item_id)
+            )
+            # keep failures for the consumer that awaits the task; if nobody
+            # does, swallow them so asyncio doesn't log "never retrieved"
+            self._prefetch_task.add_done_callback(_consume_task_exception)
+        return data
 
     @property
     def loop(self):
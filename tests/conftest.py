@@ -5,6 +5,7 @@ import uuid
 import warnings
 from contextlib import asynccontextmanager, contextmanager
 from functools import partial
+from unittest.mock import Mock
 
 import fsspec
 import keyring
@@ -21,6 +22,18 @@ LOGIN_URL = "https://login.microsoftonline.com"
 SCOPES = ["offline_access", "openid", "Files.ReadWrite.All", "Sites.ReadWrite.All"]
 
 
+def mock_json_response(data):
+    """Build a mocked Response whose JSON body is ``data``.
+
+    Both ``.json()`` and ``.content`` are populated since the filesystem
+    parses bodies from the raw bytes when orjson is installed.
+    """
+    response = Mock()
+    response.json.return_value = data
+    response.content = json.dumps(data).encode()
+    return response
+
+
 # Test data fixtures
 @pytest.fixture(scope="session")
 def test_files():
@@ -0,0 +1,156 @@
+"""Offline tests for the helpers and request plumbing in msgraphfs.core."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from msgraphfs import MSGDriveFS
+from msgraphfs.core import _http_call_with_retry, parse_range_header
+from tests.conftest import mock_json_response
+
+
+def make_fs(drive_id):
+    """Build a filesystem with a distinct drive_id so fsspec's instance cache
+    doesn't share state with other tests."""
+    return MSGDriveFS(
+        drive_id=drive_id,
+        client_id="test-client-id",
+        tenant_id="test-tenant-id",
+        client_secret="test-client-secret",
+    )
+
+
+class TestParseRangeHeader:
+    def test_full_range(self):
+        assert parse_range_header("bytes=0-499") == (0, 499)
+
+    def test_open_ended_range(self):
+        assert parse_range_header("bytes=500-") == (500, None)
+
+    def test_suffix_range(self):
+        assert parse_range_header("bytes=-500") == (None, 500)
+
+    def test_missing_prefix_raises(self):
+        with pytest.raises(ValueError):
+            parse_range_header("0-499")
+
+    def test_missing_separator_raises(self):
+        with pytest.raises(ValueError):
+            parse_range_header("bytes=500")
+
+
+class TestTouch:
+    @pytest.mark.asyncio
+    async def test_truncate_existing_file_puts_empty_content(self):
+        fs = make_fs("touch-drive-id")
+
+        with (
+            patch.object(fs, "_msgraph_put", new=AsyncMock()) as mock_put,
+            patch.object(fs, "_msgraph_patch", new=AsyncMock()) as mock_patch,
+        ):
+            await fs._touch("/foo/bar.txt", truncate=True, item_id="item-1")
+
+        mock_patch.assert_not_awaited()
+        mock_put.assert_awaited_once()
+        url = mock_put.await_args.args[0]
+        assert url.endswith("/items/item-1/content")
+        assert mock_put.await_args.kwargs["content"] == b""
+        assert mock_put.await_args.kwargs["headers"]["Content-Type"] == "text/plain"
+
+    @pytest.mark.asyncio
+    async def test_no_truncate_patches_modification_time(self):
+        fs = make_fs("touch-drive-id")
+
+        with (
+            patch.object(fs, "_msgraph_put", new=AsyncMock()) as mock_put,
+            patch.object(fs, "_msgraph_patch", new=AsyncMock()) as mock_patch,
+        ):
+            await fs._touch("/foo/bar.txt", truncate=False, item_id="item-1")
+
+        mock_put.assert_not_awaited()
+        mock_patch.assert_awaited_once()
+        url = mock_patch.await_args.args[0]
+        assert url.endswith("/items/item-1")
+        assert "lastModifiedDateTime" in mock_patch.await_args.kwargs["json"]
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_created_in_its_parent(self):
+        fs = make_fs("touch-drive-id")
+
+        with (
+            patch.object(
+                fs, "_get_item_id", new=AsyncMock(side_effect=[None, "parent-1"])
+            ),
+            patch.object(fs, "_msgraph_put", new=AsyncMock()) as mock_put,
+        ):
+            await fs._touch("/foo/new.txt", truncate=True)
+
+        mock_put.assert_awaited_once()
+        url = mock_put.await_args.args[0]
+        assert url.endswith("/items/parent-1:/new.txt:/content")
+        assert mock_put.await_args.kwargs["content"] == b""
+
+
+class TestMsgraphBatch:
+    @pytest.mark.asyncio
+    async def test_responses_follow_request_order(self):
+        fs = make_fs("batch-drive-id")
+        requests = [
+            {"id": "0", "method": "GET", "url": "/drives/d/items/a"},
+            {"id": "1", "method": "GET", "url": "/drives/d/items/b"},
+            {"id": "2", "method": "GET", "url": "/drives/d/items/c"},
+        ]
+        # the service is allowed to answer in any order
+        shuffled = {
+            "responses": [
+                {"id": "2", "status": 200, "body": {"name": "c"}},
+                {"id": "0", "status": 200, "body": {"name": "a"}},
+                {"id": "1", "status": 200, "body": {"name": "b"}},
+            ]
+        }
+
+        with patch.object(
+            fs,
+            "_msgraph_post",
+            new=AsyncMock(return_value=mock_json_response(shuffled)),
+        ) as mock_post:
+            responses = await fs._msgraph_batch(requests)
+
+        assert [r["id"] for r in responses] == ["0", "1", "2"]
+        assert [r["body"]["name"] for r in responses] == ["a", "b", "c"]
+        mock_post.assert_awaited_once_with(
+            "https://graph.microsoft.com/v1.0/$batch", json={"requests": requests}
+        )
+
+
+class TestHttpCallWithRetry:
+    """Regression tests for the retry loop (retries used to be forced to 1)."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise httpx.ConnectError("connection reset")
+            return httpx.Response(200, request=httpx.Request("GET", "https://t/"))
+
+        response = await _http_call_with_retry(flaky, retries=3)
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_configured_attempts(self):
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise httpx.ConnectError("connection reset")
+
+        with pytest.raises(httpx.ConnectError):
+            await _http_call_with_retry(failing, retries=3)
+
+        assert len(calls) == 3
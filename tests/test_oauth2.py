@@ -1,10 +1,11 @@
 import os
 import warnings
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from msgraphfs import MSGDriveFS
+from tests.conftest import mock_json_response
 
 
 class TestOAuth2:
@@ -255,11 +256,9 @@ class TestOAuth2:
         )
 
         # Mock the HTTP responses
-        mock_site_response = Mock()
-        mock_site_response.json.return_value = {"value": [{"id": "test-site-id"}]}
+        mock_site_response = mock_json_response({"value": [{"id": "test-site-id"}]})
 
-        mock_drive_response = Mock()
-        mock_drive_response.json.return_value = {"id": "discovered-drive-id"}
+        mock_drive_response = mock_json_response({"id": "discovered-drive-id"})
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.side_effect = [mock_site_response, mock_drive_response]
@@ -276,7 +275,8 @@ class TestOAuth2:
             # Verify the correct API calls were made
             assert mock_get.call_count == 2
             mock_get.assert_any_call(
-                "https://graph.microsoft.com/v1.0/sites?search=test-site"
+                "https://graph.microsoft.com/v1.0/sites",
+                params={"search": "test-site"},
             )
             mock_get.assert_any_call(
                 "https://graph.microsoft.com/v1.0/sites/test-site-id/drive"
@@ -292,8 +292,7 @@ class TestOAuth2:
         )
 
         # Mock the HTTP response
-        mock_drive_response = Mock()
-        mock_drive_response.json.return_value = {"id": "user-default-drive-id"}
+        mock_drive_response = mock_json_response({"id": "user-default-drive-id"})
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_drive_response
@@ -322,8 +321,7 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
+        mock_response = mock_json_response({"value": []})
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_response
@@ -361,16 +359,16 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        # Force drive_url to be None to test auto-discovery
+        # Force drive_url to be None to test auto-discovery (the instance may
+        # be shared with other tests through fsspec's instance cache)
         fs.drive_id = None
         fs.drive_url = None
+        fs._site_id = None
 
         # Mock the site and drive discovery
-        mock_site_response = Mock()
-        mock_site_response.json.return_value = {"value": [{"id": "test-site-id"}]}
+        mock_site_response = mock_json_response({"value": [{"id": "test-site-id"}]})
 
-        mock_drive_response = Mock()
-        mock_drive_response.json.return_value = {"id": "discovered-drive-id"}
+        mock_drive_response = mock_json_response({"id": "discovered-drive-id"})
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.side_effect = [mock_site_response, mock_drive_response]
@@ -452,16 +450,16 @@ class TestOAuth2:
         )
 
         # Mock the HTTP responses
-        mock_site_response = Mock()
-        mock_site_response.json.return_value = {"value": [{"id": "test-site-id"}]}
-
-        mock_drives_response = Mock()
-        mock_drives_response.json.return_value = {
-            "value": [
-                {"id": "documents-drive-id", "name": "Documents"},
-                {"id": "other-drive-id", "name": "OtherLibrary"},
-            ]
-        }
+        mock_site_response = mock_json_response({"value": [{"id": "test-site-id"}]})
+
+        mock_drives_response = mock_json_response(
+            {
+                "value": [
+                    {"id": "documents-drive-id", "name": "Documents"},
+                    {"id": "other-drive-id", "name": "OtherLibrary"},
+                ]
+            }
+        )
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.side_effect = [mock_site_response, mock_drives_response]
@@ -478,7 +476,8 @@ class TestOAuth2:
             # Verify the correct API calls were made
             assert mock_get.call_count == 2
             mock_get.assert_any_call(
-                "https://graph.microsoft.com/v1.0/sites?search=test-site"
+                "https://graph.microsoft.com/v1.0/sites",
+                params={"search": "test-site"},
             )
             mock_get.assert_any_call(
                 "https://graph.microsoft.com/v1.0/sites/test-site-id/drives"
@@ -495,14 +494,15 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "value": [
-                {"id": "documents-drive-id", "name": "Documents"},
-                {"id": "shared-drive-id", "name": "Shared Documents"},
-                {"id": "archive-drive-id", "name": "Archive"},
-            ]
-        }
+        mock_response = mock_json_response(
+            {
+                "value": [
+                    {"id": "documents-drive-id", "name": "Documents"},
+                    {"id": "shared-drive-id", "name": "Shared Documents"},
+                    {"id": "archive-drive-id", "name": "Archive"},
+                ]
+            }
+        )
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_response
@@ -525,13 +525,14 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "value": [
-                {"id": "documents-drive-id", "name": "Documents"},
-                {"id": "shared-drive-id", "name": "Shared Documents"},
-            ]
-        }
+        mock_response = mock_json_response(
+            {
+                "value": [
+                    {"id": "documents-drive-id", "name": "Documents"},
+                    {"id": "shared-drive-id", "name": "Shared Documents"},
+                ]
+            }
+        )
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_response
@@ -559,8 +560,7 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
+        mock_response = mock_json_response({"value": []})
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_response
@@ -584,11 +584,9 @@ class TestOAuth2:
         )
 
         # Mock the HTTP responses
-        mock_site_response = Mock()
-        mock_site_response.json.return_value = {"value": [{"id": "test-site-id"}]}
+        mock_site_response = mock_json_response({"value": [{"id": "test-site-id"}]})
 
-        mock_drive_response = Mock()
-        mock_drive_response.json.return_value = {"id": "default-drive-id"}
+        mock_drive_response = mock_json_response({"id": "default-drive-id"})
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.side_effect = [mock_site_response, mock_drive_response]
@@ -601,7 +599,8 @@ class TestOAuth2:
             # Verify the correct API calls were made (default drive endpoint)
             assert mock_get.call_count == 2
             mock_get.assert_any_call(
-                "https://graph.microsoft.com/v1.0/sites?search=test-site"
+                "https://graph.microsoft.com/v1.0/sites",
+                params={"search": "test-site"},
             )
             mock_get.assert_any_call(
                 "https://graph.microsoft.com/v1.0/sites/test-site-id/drive"
@@ -618,13 +617,14 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "value": [
-                {"id": "documents-drive-id", "name": "Documents"},  # uppercase D
-                {"id": "shared-drive-id", "name": "Shared Documents"},
-            ]
-        }
+        mock_response = mock_json_response(
+            {
+                "value": [
+                    {"id": "documents-drive-id", "name": "Documents"},  # uppercase D
+                    {"id": "shared-drive-id", "name": "Shared Documents"},
+                ]
+            }
+        )
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_response
@@ -649,13 +649,14 @@ class TestOAuth2:
             client_secret="test-client-secret",
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "value": [
-                {"id": "custom-drive-id", "name": "Custom Library & Archives"},
-                {"id": "normal-drive-id", "name": "Documents"},
-            ]
-        }
+        mock_response = mock_json_response(
+            {
+                "value": [
+                    {"id": "custom-drive-id", "name": "Custom Library & Archives"},
+                    {"id": "normal-drive-id", "name": "Documents"},
+                ]
+            }
+        )
 
         with patch.object(fs, "_msgraph_get") as mock_get:
             mock_get.return_value = mock_response